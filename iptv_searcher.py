@@ -1,13 +1,73 @@
 import requests
-import re
 import time
 import csv
 import os
 import asyncio
 import aiohttp
-from concurrent.futures import ThreadPoolExecutor
+import atexit
+import argparse
+import socket
+import ssl
+import sys
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import AsyncResolver, ThreadedResolver
+from collections import Counter, defaultdict
+from urllib.parse import quote, urlsplit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import concurrent.futures
 
+# 可选的基于libuv的uvloop事件循环（仅支持非Windows平台，未安装时使用默认事件循环）
+uvloop = None
+if sys.platform != 'win32':
+    try:
+        import uvloop
+    except ImportError:
+        pass
+
+# 频道测试状态，统一使用驻留字符串，比较时可直接按对象身份命中
+STATUS = {k: sys.intern(k) for k in ('未测试', '可用', '不可用', '超时', '连接失败', '错误', '需手动测试', '未知协议')}
+# 计入不可用的测试状态
+FAIL_SET = frozenset({STATUS['不可用'], STATUS['超时'], STATUS['连接失败'], STATUS['错误']})
+
+# 全局复用的aiohttp会话，重新测试时保留已建立的连接、DNS缓存和SSL上下文
+_SESSION = None
+# 全局会话所属的事件循环，会话只能在创建它的事件循环中使用
+_SESSION_LOOP = None
+# 全局会话连接器使用的带缓存DNS解析器，用于测试前预解析主机
+_SESSION_RESOLVER = None
+
+# 测试链接使用的事件循环，重新测试时复用
+_LOOP = None
+
+# 快速模式共享的SSL上下文，跳过证书校验以加快握手
+_FAST_SSL_CONTEXT = None
+
+def parse_m3u_lines(lines):
+    """
+    逐行解析M3U内容，依次返回频道名称和链接地址
+    
+    M3U格式通常是：#EXTINF:-1 tvg-name="频道名称" tvg-id="" group-title="",频道名称
+    然后是链接地址
+    
+    参数:
+        lines: 可迭代的文本行
+    
+    返回:
+        (频道名称, 链接地址) 的生成器
+    """
+    lines = iter(lines)
+    for line in lines:
+        if not line.startswith('#EXTINF'):
+            continue
+        name = line.partition(',')[2].strip()
+        # 跳过空行，取下一行作为链接地址
+        link = ''
+        for next_line in lines:
+            link = next_line.strip()
+            if link:
+                break
+        yield name, link
+
 def search_iptv_links():
     """
     搜索IPTV链接并返回频道名称和链接地址的列表
@@ -23,26 +83,19 @@ def search_iptv_links():
     for retry in range(max_retries):
         try:
             print(f"正在尝试获取IPTV链接 (尝试 {retry + 1}/{max_retries})...")
-            # 获取IPTV列表数据
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            content = response.text
-            
-            # 使用正则表达式提取频道名称和链接
-            # M3U格式通常是：#EXTINF:-1 tvg-name="频道名称" tvg-id="" group-title="",频道名称
-            # 然后是链接地址
-            pattern = r'#EXTINF:-1.*?,(.*?)\n(.*?)\n'
-            matches = re.findall(pattern, content, re.DOTALL)
-            
-            # 整理结果，去重并过滤掉无效链接
-            iptv_list = []
-            seen = set()
-            for name, link in matches:
-                name = name.strip()
-                link = link.strip()
-                if link and link not in seen:
-                    iptv_list.append({"name": name, "link": link, "status": "未测试"})
-                    seen.add(link)
+            # 流式获取IPTV列表数据，边下载边解析
+            with requests.get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
+                
+                # 整理结果，去重并过滤掉无效链接
+                iptv_list = []
+                seen = set()
+                for name, link in parse_m3u_lines(response.iter_lines(decode_unicode=True)):
+                    if link and link not in seen:
+                        iptv_list.append({"name": name, "link": link, "status": STATUS['未测试']})
+                        seen.add(link)
             
             return iptv_list
         except requests.exceptions.Timeout:
@@ -58,6 +111,18 @@ def search_iptv_links():
     
     return []
 
+def count_status(iptv_list):
+    """
+    一次遍历统计各测试状态的频道数量
+    
+    参数:
+        iptv_list: IPTV频道列表
+    
+    返回:
+        以状态为键、数量为值的Counter，不存在的状态计为0
+    """
+    return Counter(c.get('status', STATUS['未测试']) for c in iptv_list)
+
 def display_iptv_list(iptv_list):
     """
     以列表形式展示IPTV频道和链接
@@ -74,7 +139,7 @@ def display_iptv_list(iptv_list):
     for index, item in enumerate(iptv_list, 1):
         name = item["name"]
         link = item["link"]
-        status = item.get("status", "未测试")
+        status = item.get("status", STATUS['未测试'])
         # 截断过长的名称和链接，以便更好地展示
         display_name = name[:27] + "..." if len(name) > 30 else name
         display_link = link[:37] + "..." if len(link) > 40 else link
@@ -83,112 +148,456 @@ def display_iptv_list(iptv_list):
     print("=" * 90)
     print(f"共找到 {len(iptv_list)} 个IPTV频道")
 
-async def async_test_single_link(session, channel, index, timeout=1):
+def is_available_status_code(status_code):
     """
-    异步测试单个IPTV链接是否可用
+    判断HTTP状态码是否表示链接可用，异步测试和线程池测试共用同一规则
+    
+    参数:
+        status_code: HTTP状态码
+    
+    返回:
+        200、206或3xx重定向时返回True
+    """
+    return status_code in (200, 206) or 300 <= status_code < 400
+
+class Progress:
+    """
+    异步测试的共享进度计数器，由各测试协程直接更新
+    """
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self.ok = 0
+        self.start_time = time.time()
+    
+    def update(self, channel):
+        """
+        记录一个已完成测试的频道
+        """
+        self.done += 1
+        if channel['status'] == STATUS['可用']:
+            self.ok += 1
+    
+    def report(self):
+        """
+        打印当前测试进度
+        """
+        elapsed_time = time.time() - self.start_time
+        speed = self.done / elapsed_time if elapsed_time > 0 else 0
+        print(f"已测试 {self.done}/{self.total} 个链接，可用: {self.ok}，速度: {speed:.1f}个/秒")
+
+async def async_report_progress(progress, interval=0.5):
+    """
+    定时打印测试进度，使打印不占用测试协程，直到被取消
+    
+    参数:
+        progress: 共享的进度计数器
+        interval: 打印间隔，默认为0.5秒
+    """
+    while True:
+        await asyncio.sleep(interval)
+        progress.report()
+
+async def async_probe_link(session, link, timeout=1):
+    """
+    异步探测单个HTTP/HTTPS链接，返回测试状态
     
     参数:
         session: aiohttp会话对象
-        channel: 包含频道信息的字典
-        index: 频道序号
+        link: 链接地址
         timeout: 测试超时时间，默认为1秒
     
     返回:
-        更新后的频道字典，包含测试结果
+        (测试状态字符串, 是否在建立连接阶段失败)
     """
-    # 只测试HTTP/HTTPS链接，其他协议直接标记为需手动测试
-    if not channel['link'].startswith(('http://', 'https://')):
-        channel['status'] = "需手动测试"
-        return channel, index
-    
     try:
-        # 使用HEAD请求，禁用重定向，设置较短超时
-        async with session.head(
-            channel['link'], 
-            timeout=timeout, 
+        # 很多IPTV/CDN源不支持HEAD请求，改用只请求首字节的GET，禁用重定向，设置较短超时
+        # total包含在连接池中排队的时间，单独设置较短的sock_connect，以区分建立连接本身超时
+        async with session.get(
+            link, 
+            timeout=aiohttp.ClientTimeout(total=timeout, sock_connect=timeout / 2), 
             allow_redirects=False,
             headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': '*/*'
+                'Accept': '*/*',
+                'Range': 'bytes=0-0'
             }
         ) as response:
-            if response.status < 400:
-                channel['status'] = "可用"
-            else:
-                channel['status'] = "不可用"
+            # 不读取响应体，直接释放连接（release而非close，使连接可以回到连接池）
+            response.release()
+            if is_available_status_code(response.status):
+                return STATUS['可用'], False
+            return STATUS['不可用'], False
+    except aiohttp.ServerTimeoutError:
+        # 未设置sock_read，该异常只来自sock_connect，即建立连接超时
+        return STATUS['超时'], True
     except asyncio.TimeoutError:
-        channel['status'] = "超时"
+        return STATUS['超时'], False
+    except aiohttp.ClientConnectorError:
+        return STATUS['连接失败'], True
     except aiohttp.ClientConnectionError:
-        channel['status'] = "连接失败"
+        return STATUS['连接失败'], False
     except Exception:
-        channel['status'] = "错误"
+        return STATUS['错误'], False
+
+def get_fast_ssl_context():
+    """
+    获取快速模式共享的SSL上下文，不校验主机名和证书
+    """
+    global _FAST_SSL_CONTEXT
+    if _FAST_SSL_CONTEXT is None:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        _FAST_SSL_CONTEXT = context
+    return _FAST_SSL_CONTEXT
+
+async def async_fast_probe_link(link, timeout=1):
+    """
+    快速模式：直接建立TCP连接，发送最简HTTP/1.0请求并只读取状态行
     
+    参数:
+        link: 链接地址
+        timeout: 测试超时时间，默认为1秒
+    
+    返回:
+        (测试状态字符串, 是否在建立连接阶段失败)
+    """
+    connected = False
+    
+    async def probe():
+        nonlocal connected
+        parts = urlsplit(link)
+        host = parts.hostname
+        default_port = 443 if parts.scheme == 'https' else 80
+        port = parts.port or default_port
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        # 与aiohttp一致，对路径中的非ASCII字符进行百分号编码
+        path = quote(path, safe="/%?=&:;@+,$!*'()~")
+        # Host头不能包含链接中的用户名和密码，非默认端口时附加端口号
+        host_header = f"[{host}]" if ':' in host else host
+        if port != default_port:
+            host_header += f":{port}"
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=get_fast_ssl_context() if parts.scheme == 'https' else None
+        )
+        connected = True
+        try:
+            writer.write(
+                f"GET {path} HTTP/1.0\r\n"
+                f"Host: {host_header}\r\n"
+                "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36\r\n"
+                "Accept: */*\r\n"
+                "Range: bytes=0-0\r\n"
+                "\r\n".encode('latin-1')
+            )
+            # 只读取状态行，例如：HTTP/1.1 200 OK
+            line = await reader.readline()
+            return int(line.split()[1])
+        finally:
+            writer.close()
+            try:
+                # 等待连接完全关闭，使TLS连接正常断开
+                await writer.wait_closed()
+            except Exception:
+                pass
+    
+    try:
+        status = await asyncio.wait_for(probe(), timeout)
+        if is_available_status_code(status):
+            return STATUS['可用'], False
+        return STATUS['不可用'], False
+    except asyncio.TimeoutError:
+        return STATUS['超时'], not connected
+    except OSError:
+        return STATUS['连接失败'], not connected
+    except Exception:
+        return STATUS['错误'], False
+
+class HostBreaker:
+    """
+    按主机熔断：从未返回过HTTP响应的主机在建立连接阶段超时一次或连续连接失败多次后，
+    其余链接不再发起请求
+    """
+    def __init__(self, max_failures=2):
+        self.max_failures = max_failures
+        self.failures = defaultdict(int)
+        self.responded = set()
+        # 已熔断的主机及触发熔断的测试状态
+        self.dead_hosts = {}
+        self.skipped = 0
+    
+    def dead_status(self, host):
+        """
+        返回主机被熔断时的测试状态，未熔断时返回None
+        """
+        return self.dead_hosts.get(host)
+    
+    def record(self, host, status, connect_failed):
+        """
+        记录一次探测结果，更新主机的熔断状态
+        
+        参数:
+            host: 主机
+            status: 测试状态
+            connect_failed: 是否在建立连接阶段失败（不含在连接池中排队的时间）
+        """
+        if status in (STATUS['可用'], STATUS['不可用']):
+            # 主机返回过HTTP响应，此后的失败只算单个链接的问题
+            self.responded.add(host)
+            self.failures.pop(host, None)
+            self.dead_hosts.pop(host, None)
+            return
+        if not connect_failed or host in self.responded:
+            return
+        if status == STATUS['超时']:
+            self.dead_hosts[host] = status
+        else:
+            self.failures[host] += 1
+            if self.failures[host] >= self.max_failures:
+                self.dead_hosts[host] = status
+
+async def async_probe_with_breaker(session, link, timeout=1, breaker=None, fast=False):
+    """
+    异步探测单个链接，所属主机已被熔断时直接返回触发熔断的测试状态
+    
+    参数:
+        session: aiohttp会话对象
+        link: 链接地址
+        timeout: 测试超时时间，默认为1秒
+        breaker: 主机熔断器，默认为None（不熔断）
+        fast: 是否使用快速模式直接探测，默认为False
+    
+    返回:
+        测试状态字符串
+    """
+    try:
+        host = urlsplit(link).netloc
+    except ValueError:
+        # 链接格式错误（如无效的IPv6地址），无法测试
+        return STATUS['错误']
+    
+    if breaker is not None:
+        dead_status = breaker.dead_status(host)
+        if dead_status is not None:
+            breaker.skipped += 1
+            return dead_status
+    
+    if fast:
+        status, connect_failed = await async_fast_probe_link(link, timeout)
+    else:
+        status, connect_failed = await async_probe_link(session, link, timeout)
+    if breaker is not None:
+        breaker.record(host, status, connect_failed)
+    return status
+
+async def async_test_single_link(session, channel, index, timeout=1, progress=None, semaphore=None, breaker=None, fast=False):
+    """
+    异步测试单个IPTV链接是否可用
+    
+    参数:
+        session: aiohttp会话对象
+        channel: 包含频道信息的字典
+        index: 频道序号
+        timeout: 测试超时时间，默认为1秒
+        progress: 共享的进度计数器，默认为None（不统计进度）
+        semaphore: 限制并发请求数的信号量，默认为None（不限制）
+        breaker: 主机熔断器，默认为None（不熔断）
+        fast: 是否使用快速模式直接探测，默认为False
+    
+    返回:
+        更新后的频道字典，包含测试结果
+    """
+    # 只测试HTTP/HTTPS链接，其他协议直接标记为需手动测试
+    if not channel['link'].startswith(('http://', 'https://')):
+        channel['status'] = STATUS['需手动测试']
+    elif semaphore is None:
+        channel['status'] = await async_probe_with_breaker(session, channel['link'], timeout, breaker, fast)
+    else:
+        async with semaphore:
+            channel['status'] = await async_probe_with_breaker(session, channel['link'], timeout, breaker, fast)
+    
+    if progress is not None:
+        progress.update(channel)
     return channel, index
 
-async def async_test_iptv_links(iptv_list, max_concurrent=200, timeout=1):
+def create_event_loop():
     """
-    异步批量测试IPTV链接是否可用
+    创建新的事件循环，已安装uvloop时使用uvloop
+    """
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+def get_test_loop():
+    """
+    获取测试链接使用的事件循环，首次调用时创建并设为当前事件循环
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = create_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+def create_resolver():
+    """
+    创建DNS解析器，优先使用基于aiodns(c-ares)的异步解析器
+    
+    返回:
+        aiohttp解析器对象，Windows或未安装aiodns时回退到线程池解析器
+    """
+    if sys.platform != 'win32':
+        try:
+            return AsyncResolver()
+        except Exception:
+            pass
+    return ThreadedResolver()
+
+class CachingResolver(AbstractResolver):
+    """
+    在底层解析器外加一层结果缓存，预解析的结果可被连接器直接复用
+    """
+    def __init__(self, resolver, ttl=600):
+        self._resolver = resolver
+        self._ttl = ttl
+        self._cache = {}
+    
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        """
+        解析主机，缓存未过期时直接返回缓存结果，解析失败不缓存
+        """
+        key = (host, port, family)
+        cached = self._cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        addrs = await self._resolver.resolve(host, port, family)
+        self._cache[key] = (addrs, time.monotonic() + self._ttl)
+        return addrs
+    
+    async def close(self):
+        """
+        关闭底层解析器
+        """
+        await self._resolver.close()
+
+async def get_session(max_concurrent=200):
+    """
+    获取全局复用的aiohttp会话，首次调用、事件循环变化或并发数变化时重新创建
     
     参数:
-        iptv_list: IPTV频道列表
-        max_concurrent: 最大并发数，默认为200
-        timeout: 每个链接的测试超时时间，默认为1秒
+        max_concurrent: 最大并发连接数，默认为200
     
     返回:
-        更新后的IPTV频道列表，包含测试结果
+        aiohttp会话对象
     """
-    if not iptv_list:
-        print("没有可测试的IPTV链接")
-        return iptv_list
+    global _SESSION, _SESSION_LOOP, _SESSION_RESOLVER
+    loop = asyncio.get_running_loop()
+    if (_SESSION is not None and not _SESSION.closed
+            and _SESSION_LOOP is loop and _SESSION.connector.limit == max_concurrent):
+        return _SESSION
     
-    print(f"\n正在异步测试 {len(iptv_list)} 个IPTV链接，并发数: {max_concurrent}，超时时间: {timeout}秒")
-    print("=" * 60)
+    if _SESSION is not None and not _SESSION.closed:
+        if _SESSION_LOOP is loop:
+            await _SESSION.close()
+        else:
+            # 旧会话绑定在其他事件循环上，无法在当前循环中关闭，直接丢弃
+            _SESSION.detach()
     
     # 创建TCP连接器，设置限制
+    resolver = CachingResolver(create_resolver())
     connector = aiohttp.TCPConnector(
         limit=max_concurrent,  # 最大并发连接数
-        ttl_dns_cache=300,     # DNS缓存时间
+        resolver=resolver,
+        ttl_dns_cache=600,     # DNS缓存时间
+        use_dns_cache=True,
         enable_cleanup_closed=True,
-        limit_per_host=100     # 每个主机的最大连接数
+        limit_per_host=100,    # 每个主机的最大连接数
+        force_close=False,     # 保持长连接，同一主机的后续链接复用连接
+        keepalive_timeout=30   # 空闲连接保留时间
     )
+    _SESSION = aiohttp.ClientSession(connector=connector)
+    _SESSION_LOOP = loop
+    _SESSION_RESOLVER = resolver
+    return _SESSION
+
+def close_session():
+    """
+    在会话所属的事件循环（即测试链接使用的事件循环）中关闭全局aiohttp会话，程序退出时自动调用
+    """
+    global _SESSION, _SESSION_LOOP, _SESSION_RESOLVER
+    if _SESSION is not None and not _SESSION.closed:
+        try:
+            if _SESSION_LOOP.is_closed() or _SESSION_LOOP.is_running():
+                _SESSION.detach()
+            else:
+                _SESSION_LOOP.run_until_complete(_SESSION.close())
+        except Exception:
+            pass
+    _SESSION = None
+    _SESSION_LOOP = None
+    _SESSION_RESOLVER = None
+
+atexit.register(close_session)
+
+async def prime_dns_cache(iptv_list, resolver, family=socket.AF_UNSPEC, timeout=3):
+    """
+    在测试前并发解析所有不重复的主机，预热解析器的DNS缓存
     
-    completed = 0
-    available_count = 0
-    start_time = time.time()
+    参数:
+        iptv_list: IPTV频道列表
+        resolver: 连接器使用的带缓存DNS解析器
+        family: 连接器使用的地址族，需与连接器一致才能命中缓存
+        timeout: 预解析的总时间上限，默认为3秒，超时后未解析的主机在测试时再解析
     
-    async with aiohttp.ClientSession(connector=connector) as session:
-        # 创建任务列表
-        tasks = []
-        for index, channel in enumerate(iptv_list):
-            task = asyncio.ensure_future(async_test_single_link(session, channel, index, timeout))
-            tasks.append(task)
-        
-        # 并发执行所有任务
-        for future in asyncio.as_completed(tasks):
-            try:
-                channel, idx = await future
-                iptv_list[idx] = channel
-                completed += 1
-                if channel['status'] == "可用":
-                    available_count += 1
-                # 减少打印频率以提高速度
-                if completed % 200 == 0 or completed == len(iptv_list):
-                    elapsed_time = time.time() - start_time
-                    speed = completed / elapsed_time if elapsed_time > 0 else 0
-                    print(f"已测试 {completed}/{len(iptv_list)} 个链接，可用: {available_count}，速度: {speed:.1f}个/秒")
-            except Exception as e:
-                print(f"测试出错: {e}")
-                completed += 1
+    返回:
+        解析的主机数量
+    """
+    hosts = set()
+    for channel in iptv_list:
+        link = channel['link']
+        if not link.startswith(('http://', 'https://')):
+            continue
+        try:
+            parts = urlsplit(link)
+            port = parts.port or (443 if parts.scheme == 'https' else 80)
+        except ValueError:
+            continue
+        if parts.hostname:
+            hosts.add((parts.hostname, port))
     
-    elapsed_time = time.time() - start_time
-    print(f"测试耗时: {elapsed_time:.2f}秒")
-    print("=" * 60)
-    # 统计测试结果
+    # 同一主机只解析一次，结果由解析器缓存供后续请求复用
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                *(resolver.resolve(host, port, family) for host, port in hosts),
+                return_exceptions=True
+            ),
+            timeout
+        )
+    except asyncio.TimeoutError:
+        print(f"DNS预解析超过 {timeout} 秒，跳过剩余主机")
+    except Exception as e:
+        # 预解析只是预热步骤，失败时继续测试，由连接器在请求时解析
+        print(f"DNS预解析失败，跳过: {e}")
+    return len(hosts)
+
+def print_test_summary(iptv_list, elapsed_time, tested_count):
+    """
+    打印测试结果统计
+    
+    参数:
+        iptv_list: 已测试的IPTV频道列表
+        elapsed_time: 测试耗时（秒）
+        tested_count: 实际发起测试的链接数，用于计算测试速度
+    """
     total = len(iptv_list)
-    available = available_count
-    unavailable = sum(1 for c in iptv_list if c.get('status') in ['不可用', '超时', '连接失败', '错误'])
-    manual = sum(1 for c in iptv_list if c.get('status') == '需手动测试')
-    unknown = sum(1 for c in iptv_list if c.get('status') == '未知协议')
+    status_counts = count_status(iptv_list)
+    available = status_counts[STATUS['可用']]
+    unavailable = sum(status_counts[s] for s in FAIL_SET)
+    manual = status_counts[STATUS['需手动测试']]
+    unknown = status_counts[STATUS['未知协议']]
     
     print(f"测试完成！")
     print(f"总频道数: {total}")
@@ -196,7 +605,101 @@ async def async_test_iptv_links(iptv_list, max_concurrent=200, timeout=1):
     print(f"不可用: {unavailable} ({unavailable/total*100:.1f}%)")
     print(f"需手动测试: {manual} ({manual/total*100:.1f}%)")
     print(f"未知协议: {unknown} ({unknown/total*100:.1f}%)")
-    print(f"测试速度: {total/elapsed_time:.1f}个/秒")
+    if elapsed_time > 0:
+        print(f"测试速度: {tested_count/elapsed_time:.1f}个/秒")
+
+async def async_test_iptv_links(iptv_list, max_concurrent=200, timeout=1, session=None, batch_size=2000, fast=False, quiet=False):
+    """
+    异步批量测试IPTV链接是否可用
+    
+    参数:
+        iptv_list: IPTV频道列表
+        max_concurrent: 最大并发数，默认为200
+        timeout: 每个链接的测试超时时间，默认为1秒
+        session: aiohttp会话对象，默认使用全局复用的会话
+        batch_size: 每批创建的任务数，默认为2000
+        fast: 是否使用快速模式（跳过aiohttp直接发送HTTP/1.0请求），默认为False
+        quiet: 是否不打印进度和统计结果（多进程测试的子进程使用），默认为False
+    
+    返回:
+        更新后的IPTV频道列表，包含测试结果
+    """
+    if not iptv_list:
+        print("没有可测试的IPTV链接")
+        return iptv_list
+    
+    # 预先筛出HTTP/HTTPS链接，其他协议直接标记为需手动测试，不创建测试任务
+    http_indexes = []
+    for index, channel in enumerate(iptv_list):
+        if channel['link'].startswith(('http://', 'https://')):
+            http_indexes.append(index)
+        else:
+            channel['status'] = STATUS['需手动测试']
+    http_list = [iptv_list[i] for i in http_indexes]
+    
+    if not quiet:
+        print(f"\n正在异步测试 {len(http_indexes)} 个HTTP/HTTPS链接（共 {len(iptv_list)} 个频道），并发数: {max_concurrent}，超时时间: {timeout}秒")
+        print("=" * 60)
+    
+    if fast:
+        if not quiet:
+            print("使用快速模式测试（不校验SSL证书）")
+    else:
+        if session is None:
+            session = await get_session(max_concurrent)
+        
+        # 预先批量解析DNS，避免每个链接单独解析（仅全局会话使用带缓存的解析器）
+        if session is _SESSION and _SESSION_RESOLVER is not None:
+            dns_start = time.time()
+            host_count = await prime_dns_cache(http_list, _SESSION_RESOLVER, session.connector.family)
+            if not quiet:
+                print(f"已预解析 {host_count} 个主机，耗时: {time.time() - dns_start:.2f}秒")
+    
+    progress = Progress(len(http_indexes))
+    start_time = progress.start_time
+    
+    semaphore = asyncio.Semaphore(max_concurrent)
+    breaker = HostBreaker()
+    # 由单独的任务定时打印进度，测试协程只更新计数
+    reporter_task = None if quiet else asyncio.ensure_future(async_report_progress(progress))
+    
+    try:
+        # 分批并发执行任务，避免一次性创建上万个任务，进度由各任务自行更新
+        for batch_start in range(0, len(http_indexes), batch_size):
+            batch = http_indexes[batch_start:batch_start + batch_size]
+            results = await asyncio.gather(
+                *(async_test_single_link(session, iptv_list[index], index, timeout, progress, semaphore, breaker, fast)
+                  for index in batch),
+                return_exceptions=True
+            )
+            for index, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    # 测试过程中出现未预料的异常，标记为错误并计入进度，避免保留旧的测试状态
+                    if not quiet:
+                        print(f"测试出错: {result}")
+                    iptv_list[index]['status'] = STATUS['错误']
+                    progress.update(iptv_list[index])
+                    continue
+                channel, idx = result
+                iptv_list[idx] = channel
+    finally:
+        if reporter_task is not None:
+            reporter_task.cancel()
+            try:
+                await reporter_task
+            except asyncio.CancelledError:
+                pass
+    if quiet:
+        return iptv_list
+    progress.report()
+    
+    elapsed_time = time.time() - start_time
+    print(f"测试耗时: {elapsed_time:.2f}秒")
+    if breaker.skipped:
+        print(f"已熔断 {len(breaker.dead_hosts)} 个不可达主机，跳过 {breaker.skipped} 个链接")
+    print("=" * 60)
+    # 统计测试结果
+    print_test_summary(iptv_list, elapsed_time, len(http_indexes))
     
     return iptv_list
 
@@ -214,7 +717,7 @@ def test_single_link(channel, index, timeout=1):
     """
     # 只测试HTTP/HTTPS链接，其他协议直接标记为需手动测试
     if not channel['link'].startswith(('http://', 'https://')):
-        channel['status'] = "需手动测试"
+        channel['status'] = STATUS['需手动测试']
         return channel, index
     
     try:
@@ -232,21 +735,93 @@ def test_single_link(channel, index, timeout=1):
         # 立即关闭连接
         response.close()
         # 只检查状态码，不处理响应内容
-        if response.status_code < 400:
-            channel['status'] = "可用"
+        if is_available_status_code(response.status_code):
+            channel['status'] = STATUS['可用']
         else:
-            channel['status'] = "不可用"
+            channel['status'] = STATUS['不可用']
     except requests.exceptions.Timeout:
-        channel['status'] = "超时"
+        channel['status'] = STATUS['超时']
     except requests.exceptions.ConnectionError:
-        channel['status'] = "连接失败"
+        channel['status'] = STATUS['连接失败']
     except Exception:
         # 简化错误处理，不获取详细错误信息
-        channel['status'] = "错误"
+        channel['status'] = STATUS['错误']
     
     return channel, index
 
-def test_iptv_links(iptv_list, max_workers=200, timeout=1):
+def test_iptv_shard(shard, max_concurrent=200, timeout=1, fast=False):
+    """
+    在子进程中使用独立的事件循环异步测试一组IPTV链接
+    
+    参数:
+        shard: 分配给该进程的IPTV频道列表
+        max_concurrent: 该进程的最大并发数，默认为200
+        timeout: 每个链接的测试超时时间，默认为1秒
+        fast: 是否使用快速模式测试，默认为False
+    
+    返回:
+        与shard顺序一致的测试状态列表
+    """
+    loop = create_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        shard = loop.run_until_complete(async_test_iptv_links(shard, max_concurrent=max_concurrent, timeout=timeout, fast=fast, quiet=True))
+        close_session()
+        return [c['status'] for c in shard]
+    finally:
+        loop.close()
+
+def test_iptv_links_multiprocess(iptv_list, processes, max_workers=200, timeout=1, fast=False):
+    """
+    按主机将IPTV链接分组到多个进程并行测试，突破单个事件循环的GIL限制
+    
+    参数:
+        iptv_list: IPTV频道列表
+        processes: 进程数
+        max_workers: 所有进程合计的最大并发数，默认为200
+        timeout: 每个链接的测试超时时间，默认为1秒
+        fast: 是否使用快速模式测试，默认为False
+    
+    返回:
+        更新后的IPTV频道列表，包含测试结果
+    """
+    print(f"\n正在使用 {processes} 个进程测试 {len(iptv_list)} 个IPTV链接，并发数: {max_workers}，超时时间: {timeout}秒")
+    print("=" * 60)
+    
+    # 同一主机的链接分到同一进程，以便复用连接、DNS缓存和主机熔断状态
+    shards = [[] for _ in range(processes)]
+    shard_indexes = [[] for _ in range(processes)]
+    for index, channel in enumerate(iptv_list):
+        try:
+            shard_id = hash(urlsplit(channel['link']).netloc) % processes
+        except ValueError:
+            # 链接格式错误，无法取得主机，统一分到第一个进程
+            shard_id = 0
+        shards[shard_id].append(channel)
+        shard_indexes[shard_id].append(index)
+    
+    start_time = time.time()
+    max_concurrent = max(1, max_workers // processes)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(test_iptv_shard, shard, max_concurrent, timeout, fast)
+            for shard in shards if shard
+        ]
+        indexes = [idx for idx in shard_indexes if idx]
+        for future, idx in zip(futures, indexes):
+            for index, status in zip(idx, future.result()):
+                iptv_list[index]['status'] = status
+    
+    elapsed_time = time.time() - start_time
+    print(f"测试耗时: {elapsed_time:.2f}秒")
+    print("=" * 60)
+    # 统计测试结果
+    tested_count = sum(1 for c in iptv_list if c['link'].startswith(('http://', 'https://')))
+    print_test_summary(iptv_list, elapsed_time, tested_count)
+    
+    return iptv_list
+
+def test_iptv_links(iptv_list, max_workers=200, timeout=1, fast=False, processes=1):
     """
     批量测试IPTV链接是否可用，优先使用异步方式
     
@@ -254,14 +829,22 @@ def test_iptv_links(iptv_list, max_workers=200, timeout=1):
         iptv_list: IPTV频道列表
         max_workers: 最大并发数，默认为200
         timeout: 每个链接的测试超时时间，默认为1秒
+        fast: 是否使用快速模式测试，默认为False
+        processes: 测试使用的进程数，默认为1（在当前进程中测试）
     
     返回:
         更新后的IPTV频道列表，包含测试结果
     """
+    if processes > 1 and iptv_list:
+        try:
+            return test_iptv_links_multiprocess(iptv_list, processes, max_workers=max_workers, timeout=timeout, fast=fast)
+        except Exception as e:
+            print(f"多进程测试失败，使用单进程方式: {e}")
+    
     try:
         # 尝试使用异步方式测试
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(async_test_iptv_links(iptv_list, max_concurrent=max_workers, timeout=timeout))
+        loop = get_test_loop()
+        return loop.run_until_complete(async_test_iptv_links(iptv_list, max_concurrent=max_workers, timeout=timeout, fast=fast))
     except Exception as e:
         print(f"异步测试失败，使用线程池方式: {e}")
         # 回退到线程池方式
@@ -290,7 +873,7 @@ def test_iptv_links(iptv_list, max_workers=200, timeout=1):
                     channel, idx = future.result()
                     iptv_list[idx] = channel
                     completed += 1
-                    if channel['status'] == "可用":
+                    if channel['status'] == STATUS['可用']:
                         available_count += 1
                     # 减少打印频率以提高速度
                     if completed % 200 == 0 or completed == len(iptv_list):
@@ -307,9 +890,10 @@ def test_iptv_links(iptv_list, max_workers=200, timeout=1):
         # 统计测试结果
         total = len(iptv_list)
         available = available_count
-        unavailable = sum(1 for c in iptv_list if c.get('status') in ['不可用', '超时', '连接失败', '错误'])
-        manual = sum(1 for c in iptv_list if c.get('status') == '需手动测试')
-        unknown = sum(1 for c in iptv_list if c.get('status') == '未知协议')
+        status_counts = count_status(iptv_list)
+        unavailable = sum(status_counts[s] for s in FAIL_SET)
+        manual = status_counts[STATUS['需手动测试']]
+        unknown = status_counts[STATUS['未知协议']]
         
         print(f"测试完成！")
         print(f"总频道数: {total}")
@@ -335,17 +919,13 @@ def export_to_csv(iptv_list, filename="iptv_channels.csv"):
     
     try:
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['序号', '频道名称', '链接地址', '状态']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(csvfile)
             
-            writer.writeheader()
-            for index, item in enumerate(iptv_list, 1):
-                writer.writerow({
-                    '序号': index,
-                    '频道名称': item['name'],
-                    '链接地址': item['link'],
-                    '状态': item.get('status', '未测试')
-                })
+            writer.writerow(['序号', '频道名称', '链接地址', '状态'])
+            writer.writerows(
+                (index, item['name'], item['link'], item.get('status', STATUS['未测试']))
+                for index, item in enumerate(iptv_list, 1)
+            )
         
         print(f"\n已成功将 {len(iptv_list)} 个IPTV频道导出到 {os.path.abspath(filename)}")
     except Exception as e:
@@ -364,15 +944,19 @@ def export_to_txt(iptv_list, filename="iptv_channels.txt"):
         return
     
     try:
+        # 先拼接完整内容，再一次性写入文件
+        lines = [
+            "IPTV频道列表\n",
+            "=" * 100 + "\n",
+            f"{'序号':<5} {'频道名称':<30} {'链接地址':<50} {'状态':<15}\n",
+            "=" * 100 + "\n"
+        ]
+        lines.extend(
+            f"{index:<5} {item['name']:<30} {item['link']:<50} {item.get('status', STATUS['未测试']):<15}\n"
+            for index, item in enumerate(iptv_list, 1)
+        )
         with open(filename, 'w', encoding='utf-8') as txtfile:
-            txtfile.write("IPTV频道列表\n")
-            txtfile.write("=" * 100 + "\n")
-            txtfile.write(f"{'序号':<5} {'频道名称':<30} {'链接地址':<50} {'状态':<15}\n")
-            txtfile.write("=" * 100 + "\n")
-            
-            for index, item in enumerate(iptv_list, 1):
-                status = item.get('status', '未测试')
-                txtfile.write(f"{index:<5} {item['name']:<30} {item['link']:<50} {status:<15}\n")
+            txtfile.write(''.join(lines))
         
         print(f"已成功将 {len(iptv_list)} 个IPTV频道导出到 {os.path.abspath(filename)}")
     except Exception as e:
@@ -393,19 +977,20 @@ def export_to_m3u(iptv_list, filename="iptv_channels.m3u", only_available=False)
     
     # 过滤可用的频道（如果需要）
     if only_available:
-        filtered_list = [c for c in iptv_list if c.get('status') == '可用']
+        filtered_list = [c for c in iptv_list if c.get('status') == STATUS['可用']]
         print(f"过滤后导出 {len(filtered_list)} 个可用频道")
     else:
         filtered_list = iptv_list
     
     try:
+        # M3U文件头，先拼接完整内容，再一次性写入文件
+        lines = ["#EXTM3U\n"]
+        lines.extend(
+            f"#EXTINF:-1 tvg-name=\"{item['name']}\" tvg-id=\"\" group-title=\"\",{item['name']}\n{item['link']}\n"
+            for item in filtered_list
+        )
         with open(filename, 'w', encoding='utf-8') as m3ufile:
-            # M3U文件头
-            m3ufile.write("#EXTM3U\n")
-            
-            for item in filtered_list:
-                m3ufile.write(f"#EXTINF:-1 tvg-name=\"{item['name']}\" tvg-id=\"\" group-title=\"\",{item['name']}\n")
-                m3ufile.write(f"{item['link']}\n")
+            m3ufile.write(''.join(lines))
         
         print(f"已成功将 {len(filtered_list)} 个IPTV频道导出为M3U格式到 {os.path.abspath(filename)}")
     except Exception as e:
@@ -415,6 +1000,13 @@ def main():
     """
     主函数
     """
+    parser = argparse.ArgumentParser(description="IPTV搜索器")
+    parser.add_argument('--fast', action='store_true',
+                        help="快速模式：直接发送HTTP/1.0请求测试链接，不校验SSL证书")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="测试链接使用的进程数，默认为1")
+    args = parser.parse_args()
+    
     print("正在搜索IPTV链接...")
     iptv_list = search_iptv_links()
     
@@ -424,10 +1016,10 @@ def main():
     
     # 自动测试所有链接的连通性
     print("\n自动测试所有链接的连通性...")
-    iptv_list = test_iptv_links(iptv_list, max_workers=300, timeout=1)
+    iptv_list = test_iptv_links(iptv_list, max_workers=300, timeout=1, fast=args.fast, processes=args.processes)
     
     # 计算可连通的频道数量
-    available_count = sum(1 for ch in iptv_list if ch['status'] == '可用')
+    available_count = count_status(iptv_list)[STATUS['可用']]
     # 直接显示可连通的数量
     print(f"\n测试完成！可连通的频道数量：{available_count} 个")
     
@@ -449,11 +1041,11 @@ def main():
         
         if choice == "1":
             # 重新测试链接
-            iptv_list = test_iptv_links(iptv_list, max_workers=300, timeout=1)
+            iptv_list = test_iptv_links(iptv_list, max_workers=300, timeout=1, fast=args.fast, processes=args.processes)
             # 显示测试结果
             display_iptv_list(iptv_list)
             # 计算可连通的频道数量
-            available_count = sum(1 for ch in iptv_list if ch['status'] == '可用')
+            available_count = count_status(iptv_list)[STATUS['可用']]
             # 用更显眼的格式显示可连通的数量
             print(f"\n" + "="*60)
             print(f"🎯 测试完成！可连通的频道数量：{available_count} 个")